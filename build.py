@@ -1,61 +1,205 @@
 #!/usr/bin/env python3
-"""Build script to convert JSX to standalone HTML with React CDN"""
+"""Build script to convert JSX to a self-contained HTML file with React and Tailwind CSS inlined"""
 
+import base64
+import hashlib
+import http.client
+import json
+import mmap
+import os
 import re
+import subprocess
+import sys
+import urllib.error
+import urllib.request
 
-# Read the JSX file
-with open('kraken-trading-bot.jsx', 'r') as f:
-    jsx_content = f.read()
+CACHE_DIR = '.cache'
+STAMP_FILE = '.build-stamp'
+JSX_FILE = 'kraken-trading-bot.jsx'
+TAILWIND_CONFIG = 'tailwind.config.js'
+VENDOR_DIR = 'vendor'
+TOOLS_DIR = 'build-tools'
 
-# Remove the import statement
-jsx_content = re.sub(r"^import React.*?;\n", "", jsx_content)
+# Pinned build tool versions; part of every cache key so an upgrade invalidates outputs.
+# They live in their own manifest (npm install --prefix build-tools) so the app's
+# package.json and lockfile stay untouched.
+with open(os.path.join(TOOLS_DIR, 'package.json'), 'r') as _f:
+    TOOL_VERSIONS = json.load(_f).get('dependencies', {})
 
-# Change 'export default function' to just 'function'
-jsx_content = jsx_content.replace('export default function KrakenTradingBot', 'function KrakenTradingBot')
+# Run the tools from build-tools/node_modules rather than whatever is on PATH
+_TOOLS_MODULES = os.path.abspath(os.path.join(TOOLS_DIR, 'node_modules'))
+TOOL_ENV = {
+    **os.environ,
+    'NODE_PATH': _TOOLS_MODULES,
+    'PATH': os.path.join(_TOOLS_MODULES, '.bin') + os.pathsep + os.environ.get('PATH', ''),
+}
 
-# Create the HTML template with Fitcher branding
-html_template = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Fitcher - AI-Powered Crypto Trading</title>
-    <meta name="description" content="Modern Nordic-inspired AI trading bot with multi-exchange support">
-    <meta name="theme-color" content="#0D1B2A">
 
-    <!-- Favicon -->
-    <link rel="icon" type="image/svg+xml" href="favicon.svg">
+def _toolchain_key(cmd):
+    """Digest identifying a tool invocation: its command line plus the pinned tool versions"""
+    return hashlib.sha256(json.dumps([cmd, TOOL_VERSIONS], sort_keys=True).encode('utf-8')).digest()
 
-    <!-- Tailwind CSS -->
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script>
-        tailwind.config = {
-            theme: {
-                extend: {
-                    colors: {
-                        nordic: {
-                            dark: '#0D1B2A',
-                            deep: '#1B2838',
-                            blue: '#4A90B8',
-                            pale: '#7FB3D3',
-                            ice: '#B8D4E8',
-                            frost: '#E8F4FC',
-                            white: '#FFFFFF'
-                        }
-                    }
-                }
-            }
-        }
-    </script>
 
-    <!-- React 18 -->
-    <script src="https://unpkg.com/react@18/umd/react.development.js" crossorigin></script>
-    <script src="https://unpkg.com/react-dom@18/umd/react-dom.development.js" crossorigin></script>
+def run_tool(cmd, name, **kwargs):
+    """Run a build tool from TOOLS_DIR, exiting with its stderr on failure; returns stdout bytes"""
+    try:
+        result = subprocess.run(cmd, capture_output=True, env=TOOL_ENV, **kwargs)
+    except FileNotFoundError:
+        sys.exit(f"❌ {cmd[0]} not found; run: npm install --prefix {TOOLS_DIR}")
+    if result.returncode != 0:
+        sys.exit(f"❌ {name} failed:\n{result.stderr.decode('utf-8', 'replace')}")
+    return result.stdout
+
+
+# (url, pinned SRI sha384) inlined into the page in this order. A bundle with no
+# pin is refused; generate one from a verified copy with
+#   openssl dgst -sha384 -binary FILE | openssl base64 -A
+VENDOR_SCRIPTS = (
+    ('https://unpkg.com/react@18.3.1/umd/react.production.min.js',
+     'sha384-DGyLxAyjq0f9SPpVevD6IgztCFlnMF6oW/XQGmfe+IsZ8TqEiDrcHkMLKI6fiB/Z'),
+    ('https://unpkg.com/react-dom@18.3.1/umd/react-dom.production.min.js',
+     'sha384-gTGxhz21lVGYNMcdJOyq01Edg0jhn/c22nsx0kyqP0TxaV5WVdsSH1fSDUf5YJj1'),
+)
+
+
+def _store_line_count(path, data):
+    newlines = data.count(b'\n')
+    write_pieces(path + '.lines', (str(newlines).encode('ascii'),))
+    return newlines
+
+
+def read_cache(path):
+    """Return (data, newline count) for a cache entry, or None on a miss
+
+    The count lives in a .lines sidecar so build stats never rescan the entry.
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    try:
+        with open(path + '.lines', 'r') as f:
+            return data, int(f.read())
+    except (OSError, ValueError):
+        return data, _store_line_count(path, data)
+
+
+def write_cache(path, data):
+    """Store a cache entry and its newline count; returns (data, newline count)
+
+    Both go through write_pieces, so an interrupted build can't leave a
+    truncated entry behind.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_pieces(path, (data,))
+    return data, _store_line_count(path, data)
+
+
+def _sri_sha384(data):
+    return 'sha384-' + base64.b64encode(hashlib.sha384(data).digest()).decode('ascii')
+
 
-    <!-- Babel for JSX -->
-    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
+def _fetch_cached(url, integrity):
+    """Download url once into VENDOR_DIR, keyed by the URL's hash, checking it against integrity
 
-    <style>
+    Returns (data, newline count).
+    """
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    cache_path = os.path.join(VENDOR_DIR, digest)
+    cached = read_cache(cache_path)
+    if cached is not None:
+        if integrity is not None and _sri_sha384(cached[0]) == integrity:
+            return cached
+        # Stale or tampered cache entry; fall through and re-download
+
+    try:
+        with urllib.request.urlopen(url, timeout=30) as resp:
+            data = resp.read()
+    # OSError covers URLError and read timeouts; HTTPException covers IncompleteRead
+    except (OSError, http.client.HTTPException) as e:
+        sys.exit(f"❌ Failed to fetch {url}: {e!r}")
+
+    actual = _sri_sha384(data)
+    if integrity is None:
+        sys.exit(f"❌ No pinned integrity for {url} (downloaded {actual}); verify it and pin it in VENDOR_SCRIPTS")
+    if actual != integrity:
+        sys.exit(f"❌ Integrity mismatch for {url}: expected {integrity}, got {actual}")
+
+    return write_cache(cache_path, data)
+
+
+_SCRIPT_CLOSE_RE = re.compile(rb'</(script)', re.I)
+
+
+def escape_inline_js(js):
+    """Keep a literal </script> (any case) inside inline JS from closing the tag early"""
+    return _SCRIPT_CLOSE_RE.sub(rb'<\\/\1', js)
+
+
+def vendor_scripts():
+    """Return the vendor bundles joined for inlining into a single <script>, and their newline count"""
+    bundles = [_fetch_cached(url, integrity) for url, integrity in VENDOR_SCRIPTS]
+    js = b'\n'.join(escape_inline_js(data) for data, _ in bundles)
+    return js, sum(newlines for _, newlines in bundles) + len(bundles) - 1
+
+
+# Transpile JSX read from stdin with @babel/core, both modules resolved via NODE_PATH.
+# The classic runtime emits React.createElement against the global React; the
+# automatic runtime would emit an import, which a plain <script> can't run.
+# Project babel configs are ignored.
+BABEL_CMD = [
+    'node', '-e',
+    "process.stdout.write(require('@babel/core').transformSync("
+    "require('fs').readFileSync(0,'utf8'),{presets:[[require('@babel/preset-react'),{runtime:'classic'}]],"
+    "configFile:false,babelrc:false}).code)",
+]
+_BABEL_KEY = _toolchain_key(BABEL_CMD)
+
+
+def transpile_jsx(chunks):
+    """Compile JSX (a sequence of byte buffers) to plain JS bytes, caching the output by toolchain + source hash
+
+    Returns (js, newline count).
+    """
+    h = hashlib.sha256(_BABEL_KEY)
+    for chunk in chunks:
+        h.update(chunk)
+    digest = h.hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f'jsx-{digest}.js')
+    cached = read_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    js = run_tool(BABEL_CMD, 'Babel transpile', input=b''.join(chunks))
+    return write_cache(cache_path, js)
+
+
+# Emit minified Tailwind CSS for the classes used in the JSX (see tailwind.config.js)
+TAILWIND_CMD = ['tailwindcss', '-c', TAILWIND_CONFIG, '--minify']
+_TAILWIND_KEY = _toolchain_key(TAILWIND_CMD)
+
+
+def build_tailwind_css(jsx_src, config_src):
+    """Generate Tailwind CSS for the JSX, caching the output by toolchain + config + JSX hash
+
+    Returns (css, newline count).
+    """
+    h = hashlib.sha256(_TAILWIND_KEY + config_src + b'\0')
+    h.update(jsx_src)
+    digest = h.hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f'tailwind-{digest}.css')
+    cached = read_cache(cache_path)
+    if cached is not None:
+        return cached
+
+    css = run_tool(TAILWIND_CMD, 'Tailwind build')
+    return write_cache(cache_path, css)
+
+
+# Page styles shared by every branded template
+SHARED_STYLE = '''    <style>
+TAILWIND_CSS_PLACEHOLDER
         * { box-sizing: border-box; }
         body {
             margin: 0;
@@ -120,7 +264,27 @@ html_template = '''<!DOCTYPE html>
             letter-spacing: -0.5px;
         }
     </style>
-</head>
+'''
+
+# Create the HTML template with Fitcher branding
+FITCHER_TEMPLATE = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Fitcher - AI-Powered Crypto Trading</title>
+    <meta name="description" content="Modern Nordic-inspired AI trading bot with multi-exchange support">
+    <meta name="theme-color" content="#0D1B2A">
+
+    <!-- Favicon -->
+    <link rel="icon" type="image/svg+xml" href="favicon.svg">
+
+    <!-- React 18 -->
+    <script>
+VENDOR_SCRIPTS_PLACEHOLDER
+    </script>
+
+''' + SHARED_STYLE + '''</head>
 <body>
     <div id="root">
         <div style="display: flex; flex-direction: column; align-items: center; justify-content: center; height: 100vh; color: white;">
@@ -132,7 +296,7 @@ html_template = '''<!DOCTYPE html>
         </div>
     </div>
 
-    <script type="text/babel">
+    <script>
         // Make React hooks available globally
         const { useState, useEffect, useCallback, useRef } = React;
 
@@ -142,18 +306,229 @@ JSX_CONTENT_PLACEHOLDER
 
         // ==================== RENDER APP ====================
         const root = ReactDOM.createRoot(document.getElementById('root'));
-        root.render(<KrakenTradingBot />);
+        root.render(React.createElement(KrakenTradingBot));
     </script>
 </body>
 </html>'''
 
-# Insert the JSX content
-final_html = html_template.replace('JSX_CONTENT_PLACEHOLDER', jsx_content)
+# Output path -> HTML template; the JSX is read and transpiled once for all of them
+TEMPLATES = {
+    'index.html': FITCHER_TEMPLATE,
+}
+
+# Build-time content spliced into each template, in document order
+PLACEHOLDERS = (b'VENDOR_SCRIPTS_PLACEHOLDER', b'TAILWIND_CSS_PLACEHOLDER', b'JSX_CONTENT_PLACEHOLDER')
+
+
+_PRESERVE_RE = re.compile(r'<(script|pre)\b.*?</\1>', re.S | re.I)
+_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.S)
+_STYLE_RE = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.S | re.I)
+_INDENT_RE = re.compile(r'\n\s+')
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCT_RE = re.compile(r'\s*([{};])\s*')
+
+
+def _minify_css(css):
+    css = _CSS_COMMENT_RE.sub('', css)
+    css = _CSS_SPACE_RE.sub(' ', css)
+    return _CSS_PUNCT_RE.sub(r'\1', css).strip()
+
+
+def _minify_markup(html):
+    html = _COMMENT_RE.sub('', html)
+    html = _STYLE_RE.sub(lambda m: m.group(1) + _minify_css(m.group(2)) + m.group(3), html)
+    return _INDENT_RE.sub('\n', html)
+
+
+def minify_html(html):
+    """Strip comments and indentation from template markup, leaving <script>/<pre> bodies untouched"""
+    out = []
+    pos = 0
+    for m in _PRESERVE_RE.finditer(html):
+        out += (_minify_markup(html[pos:m.start()]), m.group(0))
+        pos = m.end()
+    out.append(_minify_markup(html[pos:]))
+    return ''.join(out)
+
+
+def _split_template(tmpl):
+    """Minify a template and split it into the static segments around each of PLACEHOLDERS"""
+    segments = []
+    rest = minify_html(tmpl).encode('utf-8')
+    for placeholder in PLACEHOLDERS:
+        segment, rest = rest.split(placeholder, 1)
+        segments.append(segment)
+    segments.append(rest)
+    return segments
+
+
+# Split once around the placeholders so the generated content can be streamed in between
+_SEGMENTS = {out: _split_template(tmpl) for out, tmpl in TEMPLATES.items()}
+
+# Template line counts, so the build stats never rescan the assembled output
+_SEGMENT_NEWLINES = {
+    out: sum(seg.count(b'\n') for seg in segments)
+    for out, segments in _SEGMENTS.items()
+}
+
+# Mixed into the build stamp so template, minifier, vendor or toolchain edits also trigger a rebuild
+_TEMPLATE_DIGEST = hashlib.sha256(
+    b''.join(out.encode('utf-8') + b'\0' + b'\0'.join(segments) for out, segments in _SEGMENTS.items())
+    + json.dumps(VENDOR_SCRIPTS).encode('utf-8')
+    + _BABEL_KEY + _TAILWIND_KEY
+).digest()
+
+
+def read_stamp():
+    """Return the stamp dict recorded by the last build, or {}"""
+    try:
+        with open(STAMP_FILE, 'r') as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return stamp if isinstance(stamp, dict) else {}
+
+
+def write_stamp(stamp):
+    with open(STAMP_FILE, 'w') as f:
+        json.dump(stamp, f)
+
+
+def output_stats():
+    """Return {output: [size, mtime_ns]} for every output, or None if any is missing"""
+    stats = {}
+    for out in TEMPLATES:
+        try:
+            st = os.stat(out)
+        except FileNotFoundError:
+            return None
+        stats[out] = [st.st_size, st.st_mtime_ns]
+    return stats
+
+
+def write_pieces(path, pieces):
+    """Write pieces to path atomically, gathering them into as few syscalls as possible"""
+    tmp = path + '.tmp'
+    if not hasattr(os, 'writev'):  # e.g. Windows
+        with open(tmp, 'wb') as f:
+            f.writelines(pieces)
+        os.replace(tmp, path)
+        return
+
+    views = [memoryview(piece) for piece in pieces]
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while views:
+            written = os.writev(fd, views)
+            # Drop fully written pieces and resume partway through the next one
+            while views and written >= len(views[0]):
+                written -= len(views[0])
+                views.pop(0)
+            if views:
+                views[0] = views[0][written:]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def build():
+    # Cheap check first: unchanged stats on the inputs mean nothing to rebuild
+    jsx_stat = os.stat(JSX_FILE)
+    config_stat = os.stat(TAILWIND_CONFIG)
+    file_key = {
+        'mtime_ns': jsx_stat.st_mtime_ns,
+        'size': jsx_stat.st_size,
+        'config_mtime_ns': config_stat.st_mtime_ns,
+        'config_size': config_stat.st_size,
+        'template_sha256': _TEMPLATE_DIGEST.hex(),
+    }
+    stamp = read_stamp()
+    # Outputs are tracked in git, so a checkout can swap in an older page; only
+    # trust them if they are exactly what the last build wrote
+    out_stats = output_stats()
+    outputs_fresh = out_stats is not None and stamp.get('outputs') == out_stats
+    if outputs_fresh and all(stamp.get(k) == v for k, v in file_key.items()):
+        print(f"✅ {', '.join(TEMPLATES)} up to date.")
+        return
+
+    # Map the JSX file rather than reading it, so hashing and cache hits never copy it;
+    # mmap refuses empty files, so those fall back to an empty buffer
+    if jsx_stat.st_size:
+        with open(JSX_FILE, 'rb') as f:
+            jsx_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        jsx_map = b''
+    jsx_view = memoryview(jsx_map)
+    jsx_chunks = ()
+    try:
+        with open(TAILWIND_CONFIG, 'rb') as f:
+            tailwind_config = f.read()
+
+        h = hashlib.sha256(_TEMPLATE_DIGEST + tailwind_config + b'\0')
+        h.update(jsx_view)
+        digest = h.hexdigest()
+        if outputs_fresh and digest == stamp.get('sha256'):
+            # Touched but unchanged; refresh the stats so the next run takes the fast path
+            write_stamp({**file_key, 'sha256': digest, 'outputs': out_stats})
+            print(f"✅ {', '.join(TEMPLATES)} up to date.")
+            return
+
+        # Inline React so the page needs no CDN round-trips
+        vendor_js, vendor_newlines = vendor_scripts()
+
+        # Prebuild the Tailwind classes the JSX uses instead of the in-browser JIT
+        tailwind_css, css_newlines = build_tailwind_css(jsx_view, tailwind_config)
+
+        # Remove the import statement
+        start = 0
+        if jsx_map[:len(b'import React')] == b'import React':
+            nl = jsx_map.find(b'\n')
+            if nl != -1:
+                start = nl + 1
+
+        # Change 'export default function' to just 'function', as zero-copy slices around it
+        export = b'export default function KrakenTradingBot'
+        pos = jsx_map.find(export, start)
+        if pos == -1:
+            jsx_chunks = (jsx_view[start:],)
+        else:
+            jsx_chunks = (jsx_view[start:pos], b'function KrakenTradingBot', jsx_view[pos + len(export):])
+
+        # Precompile JSX so the browser doesn't need Babel
+        jsx_content, jsx_newlines = transpile_jsx(jsx_chunks)
+        jsx_content = escape_inline_js(jsx_content)
+    finally:
+        # Every view into the map must be released before it can be closed
+        for chunk in jsx_chunks:
+            if isinstance(chunk, memoryview):
+                chunk.release()
+        jsx_view.release()
+        if isinstance(jsx_map, mmap.mmap):
+            jsx_map.close()
+
+    generated = (vendor_js, tailwind_css, jsx_content)
+    generated_size = sum(len(part) for part in generated)
+    # Newline counts come from the cache sidecars, so the stats never rescan the output
+    generated_newlines = vendor_newlines + css_newlines + jsx_newlines
+
+    for out, segments in _SEGMENTS.items():
+        # Interleave the static segments with the generated content without
+        # building the combined string
+        pieces = [segments[0]]
+        for part, segment in zip(generated, segments[1:]):
+            pieces += (part, segment)
+        write_pieces(out, pieces)
+
+        total_size = sum(len(seg) for seg in segments) + generated_size
+        total_lines = _SEGMENT_NEWLINES[out] + generated_newlines
+
+        print(f"✅ Build complete! {out} created successfully.")
+        print(f"   Total size: {total_size:,} bytes")
+        print(f"   Lines: {total_lines:,}")
+
+    write_stamp({**file_key, 'sha256': digest, 'outputs': output_stats()})
 
-# Write the HTML file
-with open('index.html', 'w') as f:
-    f.write(final_html)
 
-print("✅ Build complete! index.html created successfully.")
-print(f"   Total size: {len(final_html):,} bytes")
-print(f"   Lines: {final_html.count(chr(10)):,}")
+if __name__ == '__main__':
+    build()
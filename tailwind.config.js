@@ -0,0 +1,32 @@
+// Classes the JSX assembles at runtime, e.g. `bg-${ex.color}-500/30`, which a
+// static content scan can't see
+const DYNAMIC_COLORS = ['purple', 'amber', 'blue', 'emerald', 'red', 'slate'];
+const DYNAMIC_CLASSES = ['bg', 'text', 'border'].flatMap((prefix) =>
+  DYNAMIC_COLORS.flatMap((color) =>
+    ['400', '500'].flatMap((shade) => {
+      const base = `${prefix}-${color}-${shade}`;
+      return [base, `${base}/30`, `${base}/50`];
+    })
+  )
+);
+
+/** @type {import('tailwindcss').Config} */
+module.exports = {
+  content: ['./kraken-trading-bot.jsx'],
+  safelist: DYNAMIC_CLASSES,
+  theme: {
+    extend: {
+      colors: {
+        nordic: {
+          dark: '#0D1B2A',
+          deep: '#1B2838',
+          blue: '#4A90B8',
+          pale: '#7FB3D3',
+          ice: '#B8D4E8',
+          frost: '#E8F4FC',
+          white: '#FFFFFF'
+        }
+      }
+    }
+  }
+};